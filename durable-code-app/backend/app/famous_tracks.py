@@ -15,6 +15,81 @@ if TYPE_CHECKING:
     from app.racing import TrackBoundary
 
 
+# Create iconic Spa sections: Eau Rouge, Blanchimont, Bus Stop
+_SPA_LAYOUT: tuple[tuple[float, float], ...] = (
+    (0.5, 0.9),  # Start/finish
+    (0.3, 0.8),  # Turn 1 (La Source)
+    (0.2, 0.65),  # Eau Rouge entry
+    (0.25, 0.5),  # Eau Rouge climb
+    (0.35, 0.35),  # Raidillon
+    (0.5, 0.25),  # Kemmel Straight entry
+    (0.7, 0.2),  # Les Combes
+    (0.8, 0.3),  # Malmedy
+    (0.85, 0.45),  # Rivage
+    (0.8, 0.6),  # Pouhon
+    (0.7, 0.7),  # Fagnes
+    (0.6, 0.75),  # Campus
+    (0.55, 0.82),  # La Source approach
+)
+
+# Tight, technical street circuit with hairpins and chicanes
+_MONACO_LAYOUT: tuple[tuple[float, float], ...] = (
+    (0.5, 0.85),  # Start/finish
+    (0.4, 0.75),  # Sainte Devote
+    (0.3, 0.6),  # Beau Rivage climb
+    (0.25, 0.45),  # Massenet
+    (0.2, 0.3),  # Casino Square
+    (0.25, 0.2),  # Mirabeau
+    (0.4, 0.15),  # Hairpin (Loews)
+    (0.55, 0.18),  # Portier
+    (0.7, 0.25),  # Tunnel entry
+    (0.8, 0.35),  # Tunnel exit
+    (0.82, 0.5),  # Chicane entry
+    (0.78, 0.58),  # Chicane exit
+    (0.7, 0.68),  # Tabac
+    (0.6, 0.78),  # Piscine
+    (0.55, 0.82),  # La Rascasse
+)
+
+_LAGUNA_SECA_LAYOUT: tuple[tuple[float, float], ...] = (
+    (0.5, 0.85),  # Start/finish
+    (0.3, 0.75),  # Turn 1
+    (0.2, 0.6),  # Turn 2
+    (0.25, 0.4),  # Turn 3 (Andretti Hairpin)
+    (0.4, 0.3),  # Turn 4
+    (0.6, 0.25),  # Turn 5
+    (0.75, 0.3),  # Turn 6 (Corkscrew entry)
+    (0.78, 0.42),  # Turn 7 (Corkscrew)
+    (0.75, 0.55),  # Turn 8 (Corkscrew exit)
+    (0.65, 0.65),  # Turn 9
+    (0.55, 0.75),  # Turn 10
+    (0.52, 0.82),  # Turn 11
+)
+
+_SUZUKA_LAYOUT: tuple[tuple[float, float], ...] = (
+    (0.5, 0.88),  # Start/finish
+    (0.3, 0.8),  # Turn 1
+    (0.2, 0.68),  # Turn 2 (S-curves entry)
+    (0.22, 0.54),  # Turn 3 (S-curves)
+    (0.28, 0.42),  # Turn 4
+    (0.25, 0.28),  # Turn 5 (Degner)
+    (0.35, 0.2),  # Turn 6
+    (0.5, 0.15),  # Turn 7 (Hairpin)
+    (0.65, 0.18),  # Turn 8
+    (0.75, 0.28),  # Turn 9 (Spoon entry)
+    (0.78, 0.42),  # Turn 10 (Spoon)
+    (0.72, 0.55),  # Turn 11
+    (0.68, 0.65),  # Turn 12 (130R entry)
+    (0.6, 0.75),  # Turn 13 (130R)
+    (0.55, 0.82),  # Turn 14 (Chicane)
+)
+
+
+def _scale_layout(layout: tuple[tuple[float, float], ...], width: int, height: int) -> list[tuple[float, float]]:
+    """Scale a fractional layout to canvas coordinates."""
+    return [(width * fx, height * fy) for fx, fy in layout]
+
+
 def generate_spa_inspired_track(
     width: int,
     height: int,
@@ -32,22 +107,7 @@ def generate_spa_inspired_track(
     Returns:
         TrackBoundary for Spa-inspired layout
     """
-    # Create iconic Spa sections: Eau Rouge, Blanchimont, Bus Stop
-    control_points = [
-        (width * 0.5, height * 0.9),  # Start/finish
-        (width * 0.3, height * 0.8),  # Turn 1 (La Source)
-        (width * 0.2, height * 0.65),  # Eau Rouge entry
-        (width * 0.25, height * 0.5),  # Eau Rouge climb
-        (width * 0.35, height * 0.35),  # Raidillon
-        (width * 0.5, height * 0.25),  # Kemmel Straight entry
-        (width * 0.7, height * 0.2),  # Les Combes
-        (width * 0.8, height * 0.3),  # Malmedy
-        (width * 0.85, height * 0.45),  # Rivage
-        (width * 0.8, height * 0.6),  # Pouhon
-        (width * 0.7, height * 0.7),  # Fagnes
-        (width * 0.6, height * 0.75),  # Campus
-        (width * 0.55, height * 0.82),  # La Source approach
-    ]
+    control_points = _scale_layout(_SPA_LAYOUT, width, height)
 
     return generate_boundaries_fn(control_points, track_width)
 
@@ -69,24 +129,7 @@ def generate_monaco_style_track(
     Returns:
         TrackBoundary for Monaco-style layout
     """
-    # Tight, technical street circuit with hairpins and chicanes
-    control_points = [
-        (width * 0.5, height * 0.85),  # Start/finish
-        (width * 0.4, height * 0.75),  # Sainte Devote
-        (width * 0.3, height * 0.6),  # Beau Rivage climb
-        (width * 0.25, height * 0.45),  # Massenet
-        (width * 0.2, height * 0.3),  # Casino Square
-        (width * 0.25, height * 0.2),  # Mirabeau
-        (width * 0.4, height * 0.15),  # Hairpin (Loews)
-        (width * 0.55, height * 0.18),  # Portier
-        (width * 0.7, height * 0.25),  # Tunnel entry
-        (width * 0.8, height * 0.35),  # Tunnel exit
-        (width * 0.82, height * 0.5),  # Chicane entry
-        (width * 0.78, height * 0.58),  # Chicane exit
-        (width * 0.7, height * 0.68),  # Tabac
-        (width * 0.6, height * 0.78),  # Piscine
-        (width * 0.55, height * 0.82),  # La Rascasse
-    ]
+    control_points = _scale_layout(_MONACO_LAYOUT, width, height)
 
     return generate_boundaries_fn(control_points, track_width)
 
@@ -108,20 +151,7 @@ def generate_laguna_seca_track(
     Returns:
         TrackBoundary for Laguna Seca layout
     """
-    control_points = [
-        (width * 0.5, height * 0.85),  # Start/finish
-        (width * 0.3, height * 0.75),  # Turn 1
-        (width * 0.2, height * 0.6),  # Turn 2
-        (width * 0.25, height * 0.4),  # Turn 3 (Andretti Hairpin)
-        (width * 0.4, height * 0.3),  # Turn 4
-        (width * 0.6, height * 0.25),  # Turn 5
-        (width * 0.75, height * 0.3),  # Turn 6 (Corkscrew entry)
-        (width * 0.78, height * 0.42),  # Turn 7 (Corkscrew)
-        (width * 0.75, height * 0.55),  # Turn 8 (Corkscrew exit)
-        (width * 0.65, height * 0.65),  # Turn 9
-        (width * 0.55, height * 0.75),  # Turn 10
-        (width * 0.52, height * 0.82),  # Turn 11
-    ]
+    control_points = _scale_layout(_LAGUNA_SECA_LAYOUT, width, height)
 
     return generate_boundaries_fn(control_points, track_width)
 
@@ -143,22 +173,6 @@ def generate_suzuka_style_track(
     Returns:
         TrackBoundary for Suzuka-style layout
     """
-    control_points = [
-        (width * 0.5, height * 0.88),  # Start/finish
-        (width * 0.3, height * 0.8),  # Turn 1
-        (width * 0.2, height * 0.68),  # Turn 2 (S-curves entry)
-        (width * 0.22, height * 0.54),  # Turn 3 (S-curves)
-        (width * 0.28, height * 0.42),  # Turn 4
-        (width * 0.25, height * 0.28),  # Turn 5 (Degner)
-        (width * 0.35, height * 0.2),  # Turn 6
-        (width * 0.5, height * 0.15),  # Turn 7 (Hairpin)
-        (width * 0.65, height * 0.18),  # Turn 8
-        (width * 0.75, height * 0.28),  # Turn 9 (Spoon entry)
-        (width * 0.78, height * 0.42),  # Turn 10 (Spoon)
-        (width * 0.72, height * 0.55),  # Turn 11
-        (width * 0.68, height * 0.65),  # Turn 12 (130R entry)
-        (width * 0.6, height * 0.75),  # Turn 13 (130R)
-        (width * 0.55, height * 0.82),  # Turn 14 (Chicane)
-    ]
+    control_points = _scale_layout(_SUZUKA_LAYOUT, width, height)
 
     return generate_boundaries_fn(control_points, track_width)
@@ -12,14 +12,18 @@ Interfaces: REST API endpoints for track data
 Implementation: FastAPI router with async endpoints and comprehensive validation
 """
 
+import heapq
 import math
 import random
+from array import array
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.famous_tracks import (
     generate_laguna_seca_track,
@@ -36,6 +40,8 @@ MAX_TRACK_WIDTH = 1920
 MIN_TRACK_HEIGHT = 300
 MAX_TRACK_HEIGHT = 1080
 DEFAULT_TRACK_PADDING = 60
+CENTERLINE_POINTS_PER_SEGMENT = 10
+COORDINATE_DECIMALS = 2  # Sub-pixel precision beyond 0.01px is invisible on the canvas
 
 # HTTP Status codes
 HTTP_BAD_REQUEST = 400
@@ -55,6 +61,8 @@ router = APIRouter(
 class Point2D(BaseModel):
     """2D point representation."""
 
+    model_config = ConfigDict(frozen=True)
+
     x: float = Field(..., description="X coordinate")
     y: float = Field(..., description="Y coordinate")
 
@@ -83,6 +91,8 @@ class SimpleTrack(BaseModel):
 class TrackGenerationParams(BaseModel):
     """Parameters for track generation."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     difficulty: str = Field(default="medium", pattern="^(easy|medium|hard)$", description="Track difficulty level")
     seed: int | None = Field(default=None, ge=0, le=999999, description="Seed for reproducible generation")
     width: int = Field(default=DEFAULT_TRACK_WIDTH, ge=MIN_TRACK_WIDTH, le=MAX_TRACK_WIDTH, description="Canvas width")
@@ -140,14 +150,22 @@ def generate_oval_track(width: int, height: int, padding: int = DEFAULT_TRACK_PA
     return TrackBoundary(outer=outer_points, inner=inner_points)
 
 
+_DIFFICULTY_PARAMS: dict[str, tuple[float, int, float]] = {
+    "easy": (120.0, 12, 0.15),
+    "medium": (100.0, 16, 0.22),
+    "hard": (80.0, 20, 0.28),
+}
+
+
 def get_difficulty_params(difficulty: str) -> tuple[float, int, float]:
     """Get track parameters based on difficulty level."""
-    params = {
-        "easy": (120.0, 12, 0.15),
-        "medium": (100.0, 16, 0.22),
-        "hard": (80.0, 20, 0.28),
-    }
-    return params.get(difficulty, (100.0, 16, 0.22))
+    return _DIFFICULTY_PARAMS.get(difficulty, _DIFFICULTY_PARAMS["medium"])
+
+
+def _control_point_radius_limits(bounds: tuple[int, int, float]) -> tuple[float, tuple[float, float]]:
+    """Get the (min_radius, (max_r_x, max_r_y)) clamp for control points within (width, height, padding)."""
+    width, height, padding = bounds
+    return padding + 50, (width / 2 - padding, height / 2 - padding)
 
 
 def generate_control_points(
@@ -158,16 +176,15 @@ def generate_control_points(
     bounds: tuple[int, int, float],
 ) -> list[tuple[float, float]]:
     """Generate random control points for track generation."""
-    width, height, padding = bounds
     control_points = []
-    min_radius = padding + 50
+    min_radius, max_radius = _control_point_radius_limits(bounds)
 
     for i in range(num_points):
         angle = (2 * math.pi * i) / num_points
         # Add random variation and clamp to bounds (not cryptographic use)
         var = random.uniform(-variation, variation)  # noqa: S311  # nosec B311
-        r_x = max(min_radius, min(width / 2 - padding, base_radius[0] * (1 + var)))
-        r_y = max(min_radius, min(height / 2 - padding, base_radius[1] * (1 + var)))
+        r_x = max(min_radius, min(max_radius[0], base_radius[0] * (1 + var)))
+        r_y = max(min_radius, min(max_radius[1], base_radius[1] * (1 + var)))
         control_points.append((center[0] + r_x * math.cos(angle), center[1] + r_y * math.sin(angle)))
 
     return control_points
@@ -205,6 +222,66 @@ def catmull_rom_point(
     return (x, y)
 
 
+@lru_cache(maxsize=16)
+def _catmull_rom_weights(points_per_segment: int) -> tuple[tuple[float, float, float, float], ...]:
+    """Get the Catmull-Rom basis weights for each sample of a segment."""
+    weights = []
+    for step in range(points_per_segment):
+        t = step / points_per_segment
+        t2 = t * t
+        t3 = t2 * t
+        weights.append(
+            (
+                0.5 * (-t3 + 2 * t2 - t),
+                0.5 * (3 * t3 - 5 * t2 + 2),
+                0.5 * (-3 * t3 + 4 * t2 + t),
+                0.5 * (t3 - t2),
+            )
+        )
+    return tuple(weights)
+
+
+@lru_cache(maxsize=16)
+def _catmull_rom_tangent_weights(points_per_segment: int) -> tuple[tuple[float, float, float, float], ...]:
+    """Get the derivative (d/dt) of the Catmull-Rom basis weights for each sample of a segment."""
+    weights = []
+    for step in range(points_per_segment):
+        t = step / points_per_segment
+        t2 = t * t
+        weights.append(
+            (
+                0.5 * (-3 * t2 + 4 * t - 1),
+                0.5 * (9 * t2 - 10 * t),
+                0.5 * (-9 * t2 + 8 * t + 1),
+                0.5 * (3 * t2 - 2 * t),
+            )
+        )
+    return tuple(weights)
+
+
+def _evaluate_segment(
+    p0: tuple[float, float],
+    p1: tuple[float, float],
+    p2: tuple[float, float],
+    p3: tuple[float, float],
+    weights: tuple[tuple[float, float, float, float], ...],
+) -> list[tuple[float, float]]:
+    """Sample a Catmull-Rom segment using a weight table from _catmull_rom_weights."""
+    return [
+        (w0 * p0[0] + w1 * p1[0] + w2 * p2[0] + w3 * p3[0], w0 * p0[1] + w1 * p1[1] + w2 * p2[1] + w3 * p3[1])
+        for w0, w1, w2, w3 in weights
+    ]
+
+
+_CENTERLINE_BASIS = tuple(
+    zip(
+        _catmull_rom_weights(CENTERLINE_POINTS_PER_SEGMENT),
+        _catmull_rom_tangent_weights(CENTERLINE_POINTS_PER_SEGMENT),
+        strict=True,
+    )
+)
+
+
 def calculate_normal_offset(
     current: tuple[float, float], next_point: tuple[float, float], track_width: float
 ) -> tuple[float, float]:
@@ -220,7 +297,7 @@ def calculate_normal_offset(
     """
     tangent_x = next_point[0] - current[0]
     tangent_y = next_point[1] - current[1]
-    length = math.sqrt(tangent_x**2 + tangent_y**2)
+    length = math.hypot(tangent_x, tangent_y)
 
     if length > 0:
         # Perpendicular vector
@@ -248,13 +325,12 @@ def interpolate_curve_segment(
         control_points[(segment_index + 2) % num_control],
     ]
 
+    samples = _evaluate_segment(
+        ctrl_pts[0], ctrl_pts[1], ctrl_pts[2], ctrl_pts[3], _catmull_rom_weights(points_per_segment)
+    )
     outer_points, inner_points = [], []
-    for t in range(points_per_segment):
-        t_norm = t / points_per_segment
-        outer = catmull_rom_point(ctrl_pts[0], ctrl_pts[1], ctrl_pts[2], ctrl_pts[3], t_norm)
-        next_point = catmull_rom_point(
-            ctrl_pts[0], ctrl_pts[1], ctrl_pts[2], ctrl_pts[3], min(t + 1, points_per_segment - 1) / points_per_segment
-        )
+    for t, outer in enumerate(samples):
+        next_point = samples[min(t + 1, points_per_segment - 1)]
         inner = calculate_normal_offset(outer, next_point, track_width)
         outer_points.append(Point2D(x=outer[0], y=outer[1]))
         inner_points.append(Point2D(x=inner[0], y=inner[1]))
@@ -262,101 +338,77 @@ def interpolate_curve_segment(
     return outer_points, inner_points
 
 
-def add_hairpin_turns(
-    control_points: list[tuple[float, float]], center: tuple[float, float]
-) -> list[tuple[float, float]]:
-    """Add dramatic 180-degree hairpin turns to the track."""
-    num_points = len(control_points)
-
+def _hairpin_offsets(num_points: int) -> list[tuple[int, int, float]]:
+    """Build (target, normal_index, distance) offsets for dramatic 180-degree hairpins."""
+    offsets: list[tuple[int, int, float]] = []
     for hairpin_idx, base_idx in enumerate([num_points // 4, num_points // 2, (3 * num_points) // 4]):
         if 1 < base_idx < num_points - 1:
-            base_point, prev_point, next_point = (
-                control_points[base_idx],
-                control_points[base_idx - 1],
-                control_points[(base_idx + 1) % num_points],
-            )
-            dx, dy = next_point[0] - prev_point[0], next_point[1] - prev_point[1]
-            length = math.sqrt(dx * dx + dy * dy)
-
-            if length > 0:
-                normal = (-dy / length, dx / length)
-                hairpin_distance = 80 + (hairpin_idx * 15)
-                control_points[base_idx] = (
-                    base_point[0] + normal[0] * hairpin_distance,
-                    base_point[1] + normal[1] * hairpin_distance,
-                )
-
-                if base_idx - 1 >= 0:
-                    entry = control_points[base_idx - 1]
-                    control_points[base_idx - 1] = (
-                        entry[0] + normal[0] * hairpin_distance * 0.5,
-                        entry[1] + normal[1] * hairpin_distance * 0.5,
-                    )
-
-                if base_idx + 1 < num_points:
-                    exit_pt = control_points[base_idx + 1]
-                    control_points[base_idx + 1] = (
-                        exit_pt[0] + normal[0] * hairpin_distance * 0.5,
-                        exit_pt[1] + normal[1] * hairpin_distance * 0.5,
-                    )
-
-    return control_points
+            hairpin_distance = 80 + (hairpin_idx * 15)
+            offsets.append((base_idx, base_idx, hairpin_distance))
+            offsets.append((base_idx - 1, base_idx, hairpin_distance * 0.5))
+            offsets.append((base_idx + 1, base_idx, hairpin_distance * 0.5))
+    return offsets
 
 
-def _apply_curve_offset(
-    control_points: list[tuple[float, float]], index: int, offset_dist: float, direction: int
-) -> None:
-    """Apply perpendicular offset to a control point to create curves."""
-    num_points = len(control_points)
-    prev_pt = control_points[index - 1]
-    next_pt = control_points[(index + 1) % num_points]
-
-    dx = next_pt[0] - prev_pt[0]
-    dy = next_pt[1] - prev_pt[1]
-    length = math.sqrt(dx * dx + dy * dy)
-
-    if length > 0:
-        normal_x = -dy / length * offset_dist * direction
-        normal_y = dx / length * offset_dist * direction
-        current = control_points[index]
-        control_points[index] = (current[0] + normal_x, current[1] + normal_y)
-
-
-def _add_s_curves(control_points: list[tuple[float, float]]) -> None:
-    """Add S-curves at multiple locations along the track."""
-    num_points = len(control_points)
+def _s_curve_offsets(num_points: int) -> list[tuple[int, int, float]]:
+    """Build (target, normal_index, distance) offsets for S-curves along the track."""
     s_curve_positions = [num_points // 6, num_points // 3, (2 * num_points) // 3, (5 * num_points) // 6]
-
+    offsets = []
     for idx, i in enumerate(s_curve_positions):
         if 0 < i < num_points:
             offset_dist = 50 if idx % 2 == 0 else 35
-            direction = (-1) ** idx
-            _apply_curve_offset(control_points, i, offset_dist, direction)
+            offsets.append((i, i, offset_dist * (-1) ** idx))
+    return offsets
 
 
-def _add_chicanes(control_points: list[tuple[float, float]]) -> None:
-    """Add chicane-style quick direction changes."""
-    num_points = len(control_points)
-    chicane_positions = [num_points // 4, (3 * num_points) // 4]
-
-    for idx, i in enumerate(chicane_positions):
+def _chicane_offsets(num_points: int) -> list[tuple[int, int, float]]:
+    """Build (target, normal_index, distance) offsets for chicane-style direction changes."""
+    offsets = []
+    for idx, i in enumerate([num_points // 4, (3 * num_points) // 4]):
         if 1 < i < num_points - 1:
             direction = (-1) ** idx
-            _apply_curve_offset(control_points, i, 30, direction)
+            offsets.append((i, i, 30 * direction))
+            # Adjacent point moves in the opposite direction for the chicane effect
+            offsets.append((i + 1, i, -30 * direction * 0.6))
+    return offsets
 
-            # Adjust adjacent point in opposite direction for chicane effect
-            if i + 1 < num_points:
-                prev_pt = control_points[i - 1]
-                next_pt = control_points[(i + 1) % num_points]
-                dx = next_pt[0] - prev_pt[0]
-                dy = next_pt[1] - prev_pt[1]
-                length = math.sqrt(dx * dx + dy * dy)
 
-                if length > 0:
-                    normal_x = -dy / length * 30 * direction
-                    normal_y = dx / length * 30 * direction
-                    next_current = control_points[i + 1]
-                    control_points[i + 1] = (next_current[0] - normal_x * 0.6, next_current[1] - normal_y * 0.6)
+def _control_point_normal(control_points: list[tuple[float, float]], index: int) -> tuple[float, float] | None:
+    """Get the unit normal at a control point from its neighbours, or None when they coincide."""
+    prev_pt = control_points[index - 1]
+    next_pt = control_points[(index + 1) % len(control_points)]
+    dx, dy = next_pt[0] - prev_pt[0], next_pt[1] - prev_pt[1]
+    length = math.hypot(dx, dy)
+    return (-dy / length, dx / length) if length > 0 else None
+
+
+def _apply_normal_offsets(
+    control_points: list[tuple[float, float]], offsets: list[tuple[int, int, float]]
+) -> list[tuple[float, float]]:
+    """Return control_points displaced along the normal at each offset's normal_index."""
+    normals: dict[int, tuple[float, float] | None] = {}
+    shifts: dict[int, tuple[float, float]] = {}
+
+    for target, normal_index, distance in offsets:
+        if normal_index not in normals:
+            normals[normal_index] = _control_point_normal(control_points, normal_index)
+        normal = normals[normal_index]
+        if normal is not None:
+            shift_x, shift_y = shifts.get(target, (0.0, 0.0))
+            shifts[target] = (shift_x + normal[0] * distance, shift_y + normal[1] * distance)
+
+    for target, (shift_x, shift_y) in shifts.items():
+        point = control_points[target]
+        control_points[target] = (point[0] + shift_x, point[1] + shift_y)
+
+    return control_points
+
+
+def add_hairpin_turns(
+    control_points: list[tuple[float, float]], center: tuple[float, float]
+) -> list[tuple[float, float]]:
+    """Add dramatic 180-degree hairpin turns to the track."""
+    return _apply_normal_offsets(control_points, _hairpin_offsets(len(control_points)))
 
 
 def add_track_variation(
@@ -375,10 +427,11 @@ def add_track_variation(
         Modified control points with added features
     """
     if variation_type == "complex":
-        _add_s_curves(control_points)
-        _add_chicanes(control_points)
+        num_points = len(control_points)
+        offsets = _s_curve_offsets(num_points) + _chicane_offsets(num_points)
         if center:
-            control_points = add_hairpin_turns(control_points, center)
+            offsets += _hairpin_offsets(num_points)
+        control_points = _apply_normal_offsets(control_points, offsets)
 
     return control_points
 
@@ -423,9 +476,7 @@ def generate_figure8_track(width: int, height: int, track_width: float) -> Track
 
 def generate_boundaries_from_centerline(control_points: list[tuple[float, float]], track_width: float) -> TrackBoundary:
     """Generate inner and outer boundaries from centerline control points."""
-    centerline_points = _interpolate_centerline(control_points)
-    boundaries = _generate_track_boundaries(centerline_points, track_width)
-    return TrackBoundary(outer=boundaries[0], inner=boundaries[1])
+    return _build_track_boundaries(control_points, track_width).to_track_boundary()
 
 
 def generate_random_track_points(
@@ -438,7 +489,7 @@ def generate_random_track_points(
         for _ in range(1000):  # max attempts
             angle, r = random.uniform(0, 2 * math.pi), random.uniform(0.3, 1.0)  # noqa: S311  # nosec B311
             pt = (center[0] + max_radius[0] * r * math.cos(angle), center[1] + max_radius[1] * r * math.sin(angle))
-            if all(math.sqrt((pt[0] - e[0]) ** 2 + (pt[1] - e[1]) ** 2) >= min_spacing for e in points):
+            if all(math.hypot(pt[0] - e[0], pt[1] - e[1]) >= min_spacing for e in points):
                 points.append(pt)
                 break
 
@@ -456,9 +507,8 @@ def _normalize_angle(angle: float) -> float:
 
 def _find_k_nearest(current: tuple[float, float], points_set: set, k: int) -> list[tuple[float, float]]:
     """Find k nearest neighbors to current point."""
-    distances = [(p, math.sqrt((p[0] - current[0]) ** 2 + (p[1] - current[1]) ** 2)) for p in points_set]
-    distances.sort(key=lambda x: x[1])
-    return [p for p, _ in distances[: min(k, len(distances))]]
+    cx, cy = current
+    return heapq.nsmallest(k, points_set, key=lambda p: (p[0] - cx) ** 2 + (p[1] - cy) ** 2)
 
 
 def _select_best_candidate(
@@ -501,6 +551,7 @@ def compute_concave_hull(points: list[tuple[float, float]], k: int = 3) -> list[
     current = start
     points_set = set(points)
     points_set.remove(start)
+    max_hull_size = len(points) * 2
 
     while points_set:
         candidates = _find_k_nearest(current, points_set, k)
@@ -517,7 +568,7 @@ def compute_concave_hull(points: list[tuple[float, float]], k: int = 3) -> list[
         current = next_point
         points_set.discard(next_point)
 
-        if len(hull) > len(points) * 2:
+        if len(hull) > max_hull_size:
             break
 
     return hull
@@ -539,17 +590,12 @@ def smooth_track_centerline(points: list[tuple[float, float]], smoothing_passes:
     smoothed = points.copy()
 
     for _ in range(smoothing_passes):
-        new_smoothed = []
-        for i, curr_pt in enumerate(smoothed):
-            prev_pt = smoothed[(i - 1) % len(smoothed)]
-            next_pt = smoothed[(i + 1) % len(smoothed)]
-
-            # Moving average
-            avg_x = (prev_pt[0] + curr_pt[0] + next_pt[0]) / 3
-            avg_y = (prev_pt[1] + curr_pt[1] + next_pt[1]) / 3
-            new_smoothed.append((avg_x, avg_y))
-
-        smoothed = new_smoothed
+        # Moving average over rotated views of the closed loop
+        previous, following = smoothed[-1:] + smoothed[:-1], smoothed[1:] + smoothed[:1]
+        smoothed = [
+            ((prev_pt[0] + curr_pt[0] + next_pt[0]) / 3, (prev_pt[1] + curr_pt[1] + next_pt[1]) / 3)
+            for prev_pt, curr_pt, next_pt in zip(previous, smoothed, following, strict=True)
+        ]
 
     return smoothed
 
@@ -567,80 +613,116 @@ class _ControlPointParams:
     width: int
     padding: int
     track_width: float
+    rng: random.Random
+
+
+@dataclass
+class _BoundaryArrays:
+    """Track boundaries as separate x/y coordinate arrays."""
+
+    outer_x: array
+    outer_y: array
+    inner_x: array
+    inner_y: array
+
+    def to_track_boundary(self) -> TrackBoundary:
+        """Return the boundaries as a TrackBoundary with coordinates rounded to COORDINATE_DECIMALS."""
+        return TrackBoundary.model_validate(
+            {
+                "outer": [
+                    {"x": round(x, COORDINATE_DECIMALS), "y": round(y, COORDINATE_DECIMALS)}
+                    for x, y in zip(self.outer_x, self.outer_y, strict=True)
+                ],
+                "inner": [
+                    {"x": round(x, COORDINATE_DECIMALS), "y": round(y, COORDINATE_DECIMALS)}
+                    for x, y in zip(self.inner_x, self.inner_y, strict=True)
+                ],
+            }
+        )
+
+
+@lru_cache(maxsize=16)
+def _unit_circle(num_points: int) -> tuple[tuple[float, float], ...]:
+    """Get (cos, sin) for num_points evenly spaced angles around the circle."""
+    return tuple(
+        (math.cos(angle), math.sin(angle)) for angle in ((2 * math.pi * i) / num_points for i in range(num_points))
+    )
 
 
 def _generate_control_points_with_variation(params: _ControlPointParams) -> list[tuple[float, float]]:
     """Generate control points with radial variation."""
     control_points = []
-    for i in range(params.num_points):
-        angle = (2 * math.pi * i) / params.num_points
-        variation = random.uniform(-params.variation_amount, params.variation_amount)  # noqa: S311  # nosec B311
+    rng = params.rng
+    min_radius, max_radius = params.padding + params.track_width, params.width / 2 - params.padding
+    for cos_angle, sin_angle in _unit_circle(params.num_points):
+        variation = rng.uniform(-params.variation_amount, params.variation_amount)
 
-        if random.random() < params.hairpin_chance:  # noqa: S311  # nosec B311
+        if rng.random() < params.hairpin_chance:
             variation *= params.hairpin_intensity
 
-        r_x = params.base_radius[0] * (1 + variation)
-        r_y = params.base_radius[1] * (1 + variation)
-
-        r_x = max(params.padding + params.track_width, min(params.width / 2 - params.padding, r_x))
-        r_y = max(params.padding + params.track_width, min(params.width / 2 - params.padding, r_y))
+        r_x = max(min_radius, min(max_radius, params.base_radius[0] * (1 + variation)))
+        r_y = max(min_radius, min(max_radius, params.base_radius[1] * (1 + variation)))
 
-        x = params.center[0] + r_x * math.cos(angle)
-        y = params.center[1] + r_y * math.sin(angle)
+        x = params.center[0] + r_x * cos_angle
+        y = params.center[1] + r_y * sin_angle
         control_points.append((x, y))
 
     return control_points
 
 
-def _interpolate_centerline(smoothed_points: list[tuple[float, float]]) -> list[tuple[float, float]]:
-    """Interpolate centerline points using Catmull-Rom splines."""
-    interpolated_centerline = []
-    num_control = len(smoothed_points)
+_Segment = tuple[tuple[float, float], tuple[float, float], tuple[float, float], tuple[float, float]]
+_Weights = tuple[float, float, float, float]
 
-    for i in range(num_control):
-        p0 = smoothed_points[(i - 1) % num_control]
-        p1 = smoothed_points[i]
-        p2 = smoothed_points[(i + 1) % num_control]
-        p3 = smoothed_points[(i + 2) % num_control]
 
-        for t in range(10):
-            t_norm = t / 10
-            point = catmull_rom_point(p0, p1, p2, p3, t_norm)
-            interpolated_centerline.append(point)
+def _blend(segment: _Segment, weights: _Weights) -> tuple[float, float]:
+    """Combine a segment's four control points with one row of basis weights."""
+    p0, p1, p2, p3 = segment
+    return (
+        weights[0] * p0[0] + weights[1] * p1[0] + weights[2] * p2[0] + weights[3] * p3[0],
+        weights[0] * p0[1] + weights[1] * p1[1] + weights[2] * p2[1] + weights[3] * p3[1],
+    )
 
-    return interpolated_centerline
 
+def _write_boundary_sample(
+    boundary: _BoundaryArrays, index: int, segment: _Segment, basis: tuple[_Weights, _Weights], half_width: float
+) -> None:
+    """Evaluate one centerline sample and store its outer/inner boundary points at index."""
+    x, y = _blend(segment, basis[0])
+    dx, dy = _blend(segment, basis[1])
+    length = math.hypot(dx, dy)
+    offset_x, offset_y = (-dy / length * half_width, dx / length * half_width) if length > 0 else (half_width, 0.0)
+
+    boundary.outer_x[index] = x + offset_x
+    boundary.outer_y[index] = y + offset_y
+    boundary.inner_x[index] = x - offset_x
+    boundary.inner_y[index] = y - offset_y
+
+
+def _build_track_boundaries(smoothed_points: list[tuple[float, float]], track_width: float) -> _BoundaryArrays:
+    """Return the inner/outer boundaries offset from the Catmull-Rom centerline through smoothed_points."""
+    samples = len(_CENTERLINE_BASIS)
+    size = len(smoothed_points) * samples
+    boundary = _BoundaryArrays(*(array("d", [0.0]) * size for _ in range(4)))
+    half_width = track_width / 2
+    segments = zip(
+        smoothed_points[-1:] + smoothed_points[:-1],
+        smoothed_points,
+        smoothed_points[1:] + smoothed_points[:1],
+        smoothed_points[2:] + smoothed_points[:2],
+        strict=True,
+    )
 
-def _generate_track_boundaries(
-    interpolated_centerline: list[tuple[float, float]], track_width: float
-) -> tuple[list[Point2D], list[Point2D]]:
-    """Generate inner and outer track boundaries from centerline."""
-    all_outer_points, all_inner_points, half_width = [], [], track_width / 2
-
-    for i, current in enumerate(interpolated_centerline):
-        next_pt = interpolated_centerline[(i + 1) % len(interpolated_centerline)]
-        dx, dy = next_pt[0] - current[0], next_pt[1] - current[1]
-        length = math.sqrt(dx * dx + dy * dy)
-
-        if length > 0:
-            normal = (-dy / length, dx / length)
-            all_outer_points.append(
-                Point2D(x=current[0] + normal[0] * half_width, y=current[1] + normal[1] * half_width)
-            )
-            all_inner_points.append(
-                Point2D(x=current[0] - normal[0] * half_width, y=current[1] - normal[1] * half_width)
-            )
-        else:
-            all_outer_points.append(Point2D(x=current[0] + half_width, y=current[1]))
-            all_inner_points.append(Point2D(x=current[0] - half_width, y=current[1]))
+    for segment_index, segment in enumerate(segments):
+        for sample, basis in enumerate(_CENTERLINE_BASIS):
+            _write_boundary_sample(boundary, segment_index * samples + sample, segment, basis, half_width)
 
-    return all_outer_points, all_inner_points
+    return boundary
 
 
 def generate_procedural_track(
     width: int,
     height: int,
-    difficulty: str,
+    difficulty_params: tuple[float, int, float],
     *,
     padding: int = DEFAULT_TRACK_PADDING,
     num_points: int | None = None,
@@ -649,44 +731,50 @@ def generate_procedural_track(
     hairpin_intensity: float | None = None,
     smoothing_passes: int | None = None,
     track_width_override: float | None = None,
+    rng: random.Random | None = None,
 ) -> TrackBoundary:
     """Generate a windy procedural track using radial variation for guaranteed continuous loop."""
-    tw, dnp, dv = get_difficulty_params(difficulty)
-    boundaries = _generate_track_boundaries(
-        _interpolate_centerline(
-            smooth_track_centerline(
-                _generate_control_points_with_variation(
-                    _ControlPointParams(
-                        num_points=num_points if num_points is not None else dnp,
-                        center=(width / 2, height / 2),
-                        base_radius=((width - 2 * padding) / 2, (height - 2 * padding) / 2),
-                        variation_amount=variation_amount if variation_amount is not None else dv,
-                        hairpin_chance=hairpin_chance if hairpin_chance is not None else 0.2,
-                        hairpin_intensity=hairpin_intensity if hairpin_intensity is not None else 2.5,
-                        width=width,
-                        padding=padding,
-                        track_width=track_width_override if track_width_override is not None else tw,
-                    )
-                ),
-                smoothing_passes if smoothing_passes is not None else 2,
-            )
+    tw, dnp, dv = difficulty_params
+    boundaries = _build_track_boundaries(
+        smooth_track_centerline(
+            _generate_control_points_with_variation(
+                _ControlPointParams(
+                    num_points=num_points if num_points is not None else dnp,
+                    center=(width / 2, height / 2),
+                    base_radius=((width - 2 * padding) / 2, (height - 2 * padding) / 2),
+                    variation_amount=variation_amount if variation_amount is not None else dv,
+                    hairpin_chance=hairpin_chance if hairpin_chance is not None else 0.2,
+                    hairpin_intensity=hairpin_intensity if hairpin_intensity is not None else 2.5,
+                    width=width,
+                    padding=padding,
+                    track_width=track_width_override if track_width_override is not None else tw,
+                    rng=rng if rng is not None else random.Random(),  # noqa: S311  # nosec B311
+                )
+            ),
+            smoothing_passes if smoothing_passes is not None else 2,
         ),
         track_width_override if track_width_override is not None else tw,
     )
 
-    if len(boundaries[0]) < 3 or len(boundaries[1]) < 3:
+    if len(boundaries.outer_x) < 3 or len(boundaries.inner_x) < 3:
         raise ValueError(
-            f"Track generation failed: insufficient points (outer={len(boundaries[0])}, inner={len(boundaries[1])})"
+            "Track generation failed: insufficient points "
+            f"(outer={len(boundaries.outer_x)}, inner={len(boundaries.inner_x)})"
         )
 
-    return TrackBoundary(outer=boundaries[0], inner=boundaries[1])
+    return boundaries.to_track_boundary()
+
+
+def _track_response(track: SimpleTrack) -> Response:
+    """Return the track serialized as a JSON response."""
+    return Response(content=track.model_dump_json(), media_type="application/json")
 
 
 @router.get("/track/simple", response_model=SimpleTrack)
 async def get_simple_track(
     width: Annotated[int, Query(ge=MIN_TRACK_WIDTH, le=MAX_TRACK_WIDTH)] = DEFAULT_TRACK_WIDTH,
     height: Annotated[int, Query(ge=MIN_TRACK_HEIGHT, le=MAX_TRACK_HEIGHT)] = DEFAULT_TRACK_HEIGHT,
-) -> SimpleTrack:
+) -> Response:
     """Get a simple oval track for initial testing.
 
     This endpoint returns a basic oval track that can be used for testing
@@ -709,74 +797,70 @@ async def get_simple_track(
         # Starting position at the bottom center of the track
         start_position = Point2D(x=width / 2, y=height - 100)
 
-        return SimpleTrack(
-            width=width, height=height, boundaries=boundaries, start_position=start_position, track_width=100
+        return _track_response(
+            SimpleTrack(
+                width=width, height=height, boundaries=boundaries, start_position=start_position, track_width=100
+            )
         )
     except Exception as e:
         logger.error("Failed to generate track", error=str(e))
         raise HTTPException(status_code=HTTP_BAD_REQUEST, detail="Failed to generate track") from e
 
 
-def _select_track_layout(params: TrackGenerationParams, track_width: float) -> TrackBoundary:
-    """Select and generate track based on layout parameter."""
-    layout_generators = {
-        "figure8": lambda: generate_figure8_track(params.width, params.height, track_width),
-        "spa": lambda: generate_spa_inspired_track(
-            params.width, params.height, track_width, generate_boundaries_from_centerline
-        ),
-        "monaco": lambda: generate_monaco_style_track(
-            params.width, params.height, track_width, generate_boundaries_from_centerline
-        ),
-        "laguna": lambda: generate_laguna_seca_track(
-            params.width, params.height, track_width, generate_boundaries_from_centerline
-        ),
-        "suzuka": lambda: generate_suzuka_style_track(
-            params.width, params.height, track_width, generate_boundaries_from_centerline
-        ),
-    }
+_LAYOUT_GENERATORS: dict[str, Callable[[int, int, float], TrackBoundary]] = {
+    "figure8": generate_figure8_track,
+    "spa": partial(generate_spa_inspired_track, generate_boundaries_fn=generate_boundaries_from_centerline),
+    "monaco": partial(generate_monaco_style_track, generate_boundaries_fn=generate_boundaries_from_centerline),
+    "laguna": partial(generate_laguna_seca_track, generate_boundaries_fn=generate_boundaries_from_centerline),
+    "suzuka": partial(generate_suzuka_style_track, generate_boundaries_fn=generate_boundaries_from_centerline),
+}
 
-    if params.layout in layout_generators:
-        return layout_generators[params.layout]()
+
+def _select_track_layout(
+    params: TrackGenerationParams, difficulty_params: tuple[float, int, float], rng: random.Random
+) -> TrackBoundary:
+    """Select and generate track based on layout parameter."""
+    layout_generator = _LAYOUT_GENERATORS.get(params.layout)
+    if layout_generator is not None:
+        return layout_generator(params.width, params.height, difficulty_params[0])
 
     return generate_procedural_track(
         params.width,
         params.height,
-        params.difficulty,
+        difficulty_params,
         num_points=params.num_points,
         variation_amount=params.variation_amount,
         hairpin_chance=params.hairpin_chance,
         hairpin_intensity=params.hairpin_intensity,
         smoothing_passes=params.smoothing_passes,
         track_width_override=params.track_width_override,
+        rng=rng,
     )
 
 
-def _find_bottom_boundary_points(
-    boundaries: TrackBoundary, center_x: float, bottom_threshold: float
-) -> tuple[list[Point2D], list[Point2D]]:
-    """Find boundary points near the bottom."""
-    inner_bottom = [p for p in boundaries.inner if p.y > bottom_threshold]
-    outer_bottom = [p for p in boundaries.outer if p.y > bottom_threshold]
-    return inner_bottom, outer_bottom
+def _closest_bottom_point(points: list[Point2D], center_x: float, bottom_threshold: float) -> Point2D | None:
+    """Find the point below bottom_threshold closest to center_x in a single pass."""
+    return min(
+        (p for p in points if p.y > bottom_threshold),
+        key=lambda p: abs(p.x - center_x),
+        default=None,
+    )
 
 
 def _calculate_start_position(boundaries: TrackBoundary, width: int, height: int) -> Point2D:
     """Calculate start position on the centerline of the track near the bottom."""
     default = Point2D(x=width / 2, y=height - 150)
-    if not boundaries.inner or not boundaries.outer:
-        return default
     center_x = width / 2
     bottom_threshold = height * 0.7
-    inner_bottom, outer_bottom = _find_bottom_boundary_points(boundaries, center_x, bottom_threshold)
-    if not inner_bottom or not outer_bottom:
+    inner_closest = _closest_bottom_point(boundaries.inner, center_x, bottom_threshold)
+    outer_closest = _closest_bottom_point(boundaries.outer, center_x, bottom_threshold)
+    if inner_closest is None or outer_closest is None:
         return default
-    inner_closest = min(inner_bottom, key=lambda p: abs(p.x - center_x))
-    outer_closest = min(outer_bottom, key=lambda p: abs(p.x - center_x))
     return Point2D(x=(inner_closest.x + outer_closest.x) / 2, y=(inner_closest.y + outer_closest.y) / 2)
 
 
 @router.post("/track/generate", response_model=SimpleTrack)
-async def generate_track(params: TrackGenerationParams) -> SimpleTrack:
+async def generate_track(params: TrackGenerationParams) -> Response:
     """Generate a procedural track based on parameters.
 
     Args:
@@ -794,20 +878,22 @@ async def generate_track(params: TrackGenerationParams) -> SimpleTrack:
         layout=params.layout,
     )
 
-    if params.seed is not None:
-        random.seed(params.seed)
+    # Request-local generator: seeding it never leaks into other requests (not cryptographic use)
+    rng = random.Random(params.seed)  # noqa: S311  # nosec B311
 
     try:
-        track_width, _, _ = get_difficulty_params(params.difficulty)
-        boundaries = _select_track_layout(params, track_width)
+        difficulty_params = get_difficulty_params(params.difficulty)
+        boundaries = _select_track_layout(params, difficulty_params, rng)
         start_position = _calculate_start_position(boundaries, params.width, params.height)
 
-        return SimpleTrack(
-            width=params.width,
-            height=params.height,
-            boundaries=boundaries,
-            start_position=start_position,
-            track_width=track_width,
+        return _track_response(
+            SimpleTrack(
+                width=params.width,
+                height=params.height,
+                boundaries=boundaries,
+                start_position=start_position,
+                track_width=difficulty_params[0],
+            )
         )
     except Exception as e:
         logger.exception("Failed to generate track", layout=params.layout)
@@ -1,9 +1,15 @@
-from fastapi import FastAPI
+import json
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
 app = FastAPI()
 
+_ROOT_BODY = json.dumps({"message": "Hello from Backend API"}).encode()
+_HEALTH_BODY = json.dumps({"status": "healthy"}).encode()
+_TEST_BODY = json.dumps({"data": "Test response from backend"}).encode()
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -14,15 +20,16 @@ app.add_middleware(
 
 @app.get("/")
 def read_root():
-    return {"message": "Hello from Backend API"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 @app.get("/api/test")
 def test_endpoint():
-    return {"data": "Test response from backend"}
+    return Response(_TEST_BODY, media_type="application/json")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http stay "auto": uvicorn picks uvloop and httptools whenever they are installed
+    uvicorn.run(app, host="0.0.0.0", port=8000, access_log=False)
@@ -0,0 +1,49 @@
+"""
+Purpose: Shared pytest configuration and fixtures for the backend test suites
+
+Scope: Hooks and fixtures shared by the FastAPI application tests run from the repository test root
+
+Overview: Provides a single session-scoped FastAPI TestClient so API tests share one wrapped ASGI app
+    instead of each test module building its own client at import time. The client is entered as a
+    context manager, so application lifespan events run once per session rather than once per module.
+    The integration suite has its own pytest.ini rootdir and does not see these fixtures.
+
+Dependencies: pytest, FastAPI TestClient, app.main
+
+Exports: pytest_configure hook, client fixture
+
+Interfaces: pytest hooks and fixtures discovered automatically for every test under test/
+
+Implementation: pytest_configure puts the backend package on sys.path once per session; session-scoped
+    generator fixture; FastAPI and the app are imported lazily so linter-only test runs do not import the backend
+"""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "durable-code-app" / "backend"
+
+
+def pytest_configure(config: pytest.Config) -> None:  # pylint: disable=unused-argument
+    """Make the backend app package importable once, before any test module is collected."""
+    backend = str(BACKEND_DIR)
+    if BACKEND_DIR.is_dir() and backend not in sys.path:
+        sys.path.insert(0, backend)
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator["TestClient"]:
+    """Provide one TestClient for the FastAPI app for the whole test session."""
+    from fastapi.testclient import TestClient  # pylint: disable=import-outside-toplevel
+
+    from app.main import app  # pylint: disable=import-outside-toplevel
+
+    with TestClient(app) as test_client:
+        yield test_client
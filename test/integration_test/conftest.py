@@ -0,0 +1,51 @@
+"""
+Purpose: pytest configuration for the integration test suite
+
+Scope: Import path setup and shared fixtures for integration tests, run with this directory as their pytest rootdir
+
+Overview: The integration suite carries its own pytest.ini, so pytest treats this directory as the rootdir and
+    does not load test/conftest.py. This conftest puts the backend package on sys.path once per session so
+    integration test modules can import the FastAPI app directly instead of each editing sys.path at import.
+    It also provides the session-scoped TestClient, mirroring test/conftest.py, so integration modules share one
+    client and the application lifespan runs once per session.
+
+Dependencies: pytest, pathlib, sys, FastAPI TestClient, app.main
+
+Exports: pytest_configure hook, client fixture
+
+Interfaces: pytest hooks and fixtures discovered automatically for every test in this directory
+
+Implementation: pytest_configure inserts the backend directory on sys.path if it is not already present;
+    session-scoped generator fixture; FastAPI and the app are imported lazily so the browser-only playwright
+    tests do not import the backend
+"""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent / "durable-code-app" / "backend"
+
+
+def pytest_configure(config: pytest.Config) -> None:  # pylint: disable=unused-argument
+    """Make the backend app package importable once, before any test module is collected."""
+    backend = str(BACKEND_DIR)
+    if BACKEND_DIR.is_dir() and backend not in sys.path:
+        sys.path.insert(0, backend)
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator["TestClient"]:
+    """Provide one TestClient for the FastAPI app for the whole test session."""
+    from fastapi.testclient import TestClient  # pylint: disable=import-outside-toplevel
+
+    from app.main import app  # pylint: disable=import-outside-toplevel
+
+    with TestClient(app) as test_client:
+        yield test_client
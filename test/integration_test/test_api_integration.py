@@ -10,7 +10,7 @@ Overview: Comprehensive integration test suite that validates the FastAPI applic
     and confirm proper application behavior in CI/CD environments. The suite provides confidence in
     deployment readiness and system integration.
 
-Dependencies: pytest, FastAPI test client, pathlib, os for environment variables
+Dependencies: pytest, session-scoped FastAPI test client fixture from conftest.py, os for environment variables
 
 Exports: Integration test functions for API endpoints and database connectivity
 
@@ -20,22 +20,13 @@ Implementation: Uses FastAPI TestClient with environment-based test skipping for
 """
 
 import os
-import sys
-from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
-# Add backend app to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "durable-code-app" / "backend"))
-
-from app.main import app
-
-client = TestClient(app)
-
 
 @pytest.mark.integration
-def test_api_integration() -> None:
+def test_api_integration(client: TestClient) -> None:
     """Test basic API integration."""
     # Test root endpoint
     response = client.get("/")
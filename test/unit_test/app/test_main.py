@@ -9,43 +9,33 @@ Overview: Unit test suite for the FastAPI main application module covering core
     responses, health check status reporting, CORS header presence and configuration, and overall application
     bootstrapping process. The suite ensures consistent API behavior and proper middleware integration.
 
-Dependencies: pathlib, FastAPI TestClient, sys for path manipulation, main application module
+Dependencies: FastAPI TestClient, session-scoped client fixture from test/conftest.py
 
 Exports: Unit test functions for root endpoint, health check, and CORS header validation
 
 Interfaces: Standard pytest test functions using FastAPI TestClient for endpoint testing
 
-Implementation: Uses FastAPI TestClient with path manipulation to import backend modules and validate responses
+Implementation: Uses FastAPI TestClient to import backend modules and validate responses
 """
 
-import sys
-from pathlib import Path
-
 from fastapi.testclient import TestClient
 
-# Add backend app to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "durable-code-app" / "backend"))
-
-from app.main import app
-
-client = TestClient(app)
-
 
-def test_read_root() -> None:
+def test_read_root(client: TestClient) -> None:
     """Test the root endpoint returns correct response."""
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "Welcome to Durable Code API"}
 
 
-def test_health_check() -> None:
+def test_health_check(client: TestClient) -> None:
     """Test the health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
 
-def test_cors_headers() -> None:
+def test_cors_headers(client: TestClient) -> None:
     """Test that CORS headers are properly set."""
     response = client.get("/")
     assert response.status_code == 200
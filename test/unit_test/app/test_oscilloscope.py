@@ -20,13 +20,10 @@ Implementation: Async test functions using FastAPI test client
 """
 
 import pytest
-from loguru import logger
-from app.main import app
-from app.oscilloscope import WaveformGenerator, WaveType
 from fastapi.testclient import TestClient
+from loguru import logger
 
-# Test client
-client = TestClient(app)
+from app.oscilloscope import WaveformGenerator, WaveType
 
 
 class TestWaveformGenerator:
@@ -113,7 +110,7 @@ class TestWaveformGenerator:
 class TestOscilloscopeWebSocket:
     """Test suite for oscilloscope WebSocket endpoint."""
 
-    def test_websocket_connection(self) -> None:
+    def test_websocket_connection(self, client: TestClient) -> None:
         """Test WebSocket connection establishment."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             # Connection should be established
@@ -126,7 +123,7 @@ class TestOscilloscopeWebSocket:
             data = websocket.receive_json()
             assert "timestamp" in data or "error" not in data
 
-    def test_start_command(self) -> None:
+    def test_start_command(self, client: TestClient) -> None:
         """Test start streaming command."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             # Send start command
@@ -145,7 +142,7 @@ class TestOscilloscopeWebSocket:
                 assert "parameters" in data
                 assert data["parameters"]["frequency"] == 20.0
 
-    def test_stop_command(self) -> None:
+    def test_stop_command(self, client: TestClient) -> None:
         """Test stop streaming command."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             # Start streaming
@@ -161,7 +158,7 @@ class TestOscilloscopeWebSocket:
             # After stop, no data should be streamed
             # (This is hard to test directly, but we can verify no errors)
 
-    def test_configure_command(self) -> None:
+    def test_configure_command(self, client: TestClient) -> None:
         """Test configuration change during streaming."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             # Start with sine wave
@@ -182,7 +179,7 @@ class TestOscilloscopeWebSocket:
                     assert data2["parameters"]["frequency"] == 15.0
                     break
 
-    def test_invalid_command_handling(self) -> None:
+    def test_invalid_command_handling(self, client: TestClient) -> None:
         """Test handling of invalid commands."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             # Send invalid JSON
@@ -192,7 +189,7 @@ class TestOscilloscopeWebSocket:
             data = websocket.receive_json()
             assert "error" in data or "samples" in data  # Either error or continue streaming
 
-    def test_invalid_parameters(self) -> None:
+    def test_invalid_parameters(self, client: TestClient) -> None:
         """Test validation of command parameters."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             # Send command with invalid frequency
@@ -202,7 +199,7 @@ class TestOscilloscopeWebSocket:
             data = websocket.receive_json()
             assert data is not None
 
-    def test_all_wave_types(self) -> None:
+    def test_all_wave_types(self, client: TestClient) -> None:
         """Test all supported wave types."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             for wave_type in ["sine", "square", "noise"]:
@@ -215,7 +212,7 @@ class TestOscilloscopeWebSocket:
                 # Wave type might not update immediately
                 # but should not cause errors
 
-    def test_data_format(self) -> None:
+    def test_data_format(self, client: TestClient) -> None:
         """Test the format of streamed data."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             websocket.send_json({"command": "start", "wave_type": "sine"})
@@ -238,7 +235,7 @@ class TestOscilloscopeWebSocket:
 class TestOscilloscopeHealth:
     """Test suite for oscilloscope health check endpoint."""
 
-    def test_health_check(self) -> None:
+    def test_health_check(self, client: TestClient) -> None:
         """Test health check endpoint."""
         response = client.get("/api/oscilloscope/health")
         assert response.status_code == 200
@@ -257,7 +254,7 @@ class TestOscilloscopeHealth:
 class TestOscilloscopePerformance:
     """Performance tests for oscilloscope streaming."""
 
-    def test_streaming_rate(self) -> None:
+    def test_streaming_rate(self, client: TestClient) -> None:
         """Test that streaming maintains expected data rate."""
         with client.websocket_connect("/api/oscilloscope/stream") as websocket:
             websocket.send_json({"command": "start", "wave_type": "sine", "frequency": 50.0})
@@ -8,10 +8,13 @@ Exports: Test functions for racing API
 Implementation: Unit tests with API client testing
 """
 
+import math
+import random
+from statistics import fmean
+
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
 from app.racing import (
     DEFAULT_TRACK_HEIGHT,
     DEFAULT_TRACK_WIDTH,
@@ -19,16 +22,17 @@ from app.racing import (
     MAX_TRACK_WIDTH,
     MIN_TRACK_HEIGHT,
     MIN_TRACK_WIDTH,
+    add_track_variation,
+    compute_concave_hull,
+    generate_boundaries_from_centerline,
     generate_oval_track,
 )
 
-client = TestClient(app)
-
 
 class TestRacingAPI:
     """Test suite for racing API endpoints."""
 
-    def test_health_endpoint(self):
+    def test_health_endpoint(self, client: TestClient):
         """Test the racing API health check endpoint."""
         response = client.get("/api/racing/health")
         assert response.status_code == 200
@@ -36,7 +40,7 @@ class TestRacingAPI:
         assert data["status"] == "healthy"
         assert data["service"] == "racing-api"
 
-    def test_simple_track_default_parameters(self):
+    def test_simple_track_default_parameters(self, client: TestClient):
         """Test simple track generation with default parameters."""
         response = client.get("/api/racing/track/simple")
         assert response.status_code == 200
@@ -58,7 +62,7 @@ class TestRacingAPI:
         assert "x" in data["start_position"]
         assert "y" in data["start_position"]
 
-    def test_simple_track_custom_dimensions(self):
+    def test_simple_track_custom_dimensions(self, client: TestClient):
         """Test simple track generation with custom dimensions."""
         width = 1000
         height = 800
@@ -70,25 +74,22 @@ class TestRacingAPI:
         assert data["width"] == width
         assert data["height"] == height
 
-    def test_simple_track_invalid_dimensions(self):
-        """Test simple track generation with invalid dimensions."""
-        # Test width too small
-        response = client.get(f"/api/racing/track/simple?width={MIN_TRACK_WIDTH - 1}")
-        assert response.status_code == 422
-
-        # Test width too large
-        response = client.get(f"/api/racing/track/simple?width={MAX_TRACK_WIDTH + 1}")
-        assert response.status_code == 422
-
-        # Test height too small
-        response = client.get(f"/api/racing/track/simple?height={MIN_TRACK_HEIGHT - 1}")
-        assert response.status_code == 422
-
-        # Test height too large
-        response = client.get(f"/api/racing/track/simple?height={MAX_TRACK_HEIGHT + 1}")
+    @pytest.mark.parametrize(
+        "param,value",
+        [
+            ("width", MIN_TRACK_WIDTH - 1),
+            ("width", MAX_TRACK_WIDTH + 1),
+            ("height", MIN_TRACK_HEIGHT - 1),
+            ("height", MAX_TRACK_HEIGHT + 1),
+        ],
+        ids=["width-too-small", "width-too-large", "height-too-small", "height-too-large"],
+    )
+    def test_simple_track_invalid_dimensions(self, client: TestClient, param, value):
+        """Test simple track generation rejects each out-of-range dimension."""
+        response = client.get(f"/api/racing/track/simple?{param}={value}")
         assert response.status_code == 422
 
-    def test_track_generation_endpoint(self):
+    def test_track_generation_endpoint(self, client: TestClient):
         """Test procedural track generation endpoint."""
         payload = {
             "difficulty": "medium",
@@ -105,28 +106,26 @@ class TestRacingAPI:
         assert data["height"] == 600
         assert data["track_width"] == 100  # Medium difficulty
 
-    def test_track_generation_different_difficulties(self):
-        """Test track generation with different difficulty levels."""
-        difficulties = {
-            "easy": 120,
-            "medium": 100,
-            "hard": 80
+    @pytest.mark.parametrize(
+        "difficulty,expected_width",
+        [("easy", 120), ("medium", 100), ("hard", 80)],
+        ids=["easy", "medium", "hard"],
+    )
+    def test_track_generation_different_difficulties(self, client: TestClient, difficulty, expected_width):
+        """Test track generation uses the track width of each difficulty level."""
+        payload = {
+            "difficulty": difficulty,
+            "width": 800,
+            "height": 600
         }
 
-        for difficulty, expected_width in difficulties.items():
-            payload = {
-                "difficulty": difficulty,
-                "width": 800,
-                "height": 600
-            }
-
-            response = client.post("/api/racing/track/generate", json=payload)
-            assert response.status_code == 200
+        response = client.post("/api/racing/track/generate", json=payload)
+        assert response.status_code == 200
 
-            data = response.json()
-            assert data["track_width"] == expected_width
+        data = response.json()
+        assert data["track_width"] == expected_width
 
-    def test_track_generation_invalid_difficulty(self):
+    def test_track_generation_invalid_difficulty(self, client: TestClient):
         """Test track generation with invalid difficulty."""
         payload = {
             "difficulty": "impossible",
@@ -137,7 +136,26 @@ class TestRacingAPI:
         response = client.post("/api/racing/track/generate", json=payload)
         assert response.status_code == 422
 
-    def test_track_generation_with_seed_reproducibility(self):
+    def test_track_generation_rejects_unknown_fields(self, client: TestClient):
+        """Test that unexpected request fields are rejected."""
+        payload = {"difficulty": "medium", "width": 800, "height": 600, "unknown_option": True}
+
+        response = client.post("/api/racing/track/generate", json=payload)
+        assert response.status_code == 422
+
+    def test_track_generation_quantizes_coordinates(self, client: TestClient):
+        """Test that generated boundary coordinates are rounded for the wire format."""
+        payload = {"difficulty": "medium", "seed": 42, "layout": "spa"}
+
+        response = client.post("/api/racing/track/generate", json=payload)
+        assert response.status_code == 200
+
+        boundaries = response.json()["boundaries"]
+        for point in boundaries["outer"] + boundaries["inner"]:
+            assert round(point["x"], 2) == point["x"]
+            assert round(point["y"], 2) == point["y"]
+
+    def test_track_generation_with_seed_reproducibility(self, client: TestClient):
         """Test that same seed produces same track."""
         payload = {
             "difficulty": "medium",
@@ -161,6 +179,19 @@ class TestRacingAPI:
         assert data1["height"] == data2["height"]
         assert data1["track_width"] == data2["track_width"]
 
+    def test_seeded_generation_is_isolated_from_global_random(self, client: TestClient):
+        """Test that seeded requests reproduce geometry without reseeding the global RNG."""
+        payload = {"difficulty": "medium", "seed": 4242, "width": 800, "height": 600}
+
+        random.seed(0)
+        expected_next = random.random()
+        random.seed(0)
+        first = client.post("/api/racing/track/generate", json=payload).json()
+        assert random.random() == expected_next
+
+        second = client.post("/api/racing/track/generate", json=payload).json()
+        assert first["boundaries"] == second["boundaries"]
+
 
 class TestTrackGeneration:
     """Test suite for track generation utility functions."""
@@ -179,17 +210,19 @@ class TestTrackGeneration:
             assert point.x <= 800
             assert point.y <= 600
 
-    def test_generate_oval_track_different_sizes(self):
-        """Test oval track generation with different canvas sizes."""
-        sizes = [(400, 300), (1200, 800), (600, 400)]
+    @pytest.mark.parametrize(
+        "width,height",
+        [(400, 300), (1200, 800), (600, 400)],
+        ids=["400x300", "1200x800", "600x400"],
+    )
+    def test_generate_oval_track_different_sizes(self, width, height):
+        """Test oval track generation keeps every point within each canvas size."""
+        track = generate_oval_track(width, height)
 
-        for width, height in sizes:
-            track = generate_oval_track(width, height)
-
-            # Check that all points are within bounds
-            for point in track.inner + track.outer:
-                assert 0 <= point.x <= width
-                assert 0 <= point.y <= height
+        # Check that all points are within bounds
+        for point in track.inner + track.outer:
+            assert 0 <= point.x <= width
+            assert 0 <= point.y <= height
 
     def test_generate_oval_track_with_padding(self):
         """Test oval track generation with custom padding."""
@@ -213,23 +246,49 @@ class TestTrackGeneration:
         center_x = 400
         center_y = 300
 
-        avg_outer_distance = sum(
-            ((p.x - center_x) ** 2 + (p.y - center_y) ** 2) ** 0.5
-            for p in track.outer
-        ) / len(track.outer)
-
-        avg_inner_distance = sum(
-            ((p.x - center_x) ** 2 + (p.y - center_y) ** 2) ** 0.5
-            for p in track.inner
-        ) / len(track.inner)
+        avg_outer_distance = fmean(math.hypot(p.x - center_x, p.y - center_y) for p in track.outer)
+        avg_inner_distance = fmean(math.hypot(p.x - center_x, p.y - center_y) for p in track.inner)
 
         assert avg_inner_distance < avg_outer_distance
 
+    def test_centerline_boundaries_are_track_width_apart(self):
+        """Test that each inner/outer boundary pair is offset by the full track width."""
+        angles = [step / 8 * math.tau for step in range(8)]
+        control_points = [(400 + 250 * math.cos(a), 300 + 180 * math.sin(a)) for a in angles]
+
+        track = generate_boundaries_from_centerline(control_points, 80)
+
+        assert len(track.outer) == len(track.inner) == 80
+        for outer, inner in zip(track.outer, track.inner, strict=True):
+            assert math.hypot(outer.x - inner.x, outer.y - inner.y) == pytest.approx(80, abs=0.02)
+
+    def test_concave_hull_starts_at_lowest_point_without_repeats(self):
+        """Test that the concave hull starts at the min point and never revisits a point."""
+        points = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0), (5.0, 5.0), (5.0, 12.0)]
+
+        hull = compute_concave_hull(points, k=3)
+
+        assert hull[0] == (0.0, 0.0)
+        assert len(hull) == len(set(hull))
+        assert set(hull) <= set(points)
+
+    def test_track_variation_offsets_only_feature_points(self):
+        """Test that complex variation perturbs feature points and leaves the rest in place."""
+        points = [(400 + 200 * (i % 3), 300 + 10 * i) for i in range(12)]
+
+        varied = add_track_variation(list(points), "complex", center=(400, 300))
+        untouched = add_track_variation(list(points), "none")
+
+        assert len(varied) == len(points)
+        assert untouched == points
+        assert varied[0] == points[0]
+        assert varied[3] != points[3]  # chicane / hairpin position
+
 
 class TestAPIValidation:
     """Test suite for API parameter validation."""
 
-    def test_valid_query_parameters(self):
+    def test_valid_query_parameters(self, client: TestClient):
         """Test that valid query parameters are accepted."""
         valid_params = [
             {"width": 800, "height": 600},
@@ -241,7 +300,7 @@ class TestAPIValidation:
             response = client.get("/api/racing/track/simple", params=params)
             assert response.status_code == 200
 
-    def test_boundary_values(self):
+    def test_boundary_values(self, client: TestClient):
         """Test boundary values for validation."""
         # Test minimum values
         response = client.get(
@@ -255,7 +314,7 @@ class TestAPIValidation:
         )
         assert response.status_code == 200
 
-    def test_track_generation_seed_validation(self):
+    def test_track_generation_seed_validation(self, client: TestClient):
         """Test seed validation in track generation."""
         # Valid seed
         payload = {"difficulty": "medium", "seed": 123456}
@@ -276,12 +335,12 @@ class TestAPIValidation:
 class TestErrorHandling:
     """Test suite for error handling in racing API."""
 
-    def test_nonexistent_endpoint(self):
+    def test_nonexistent_endpoint(self, client: TestClient):
         """Test that nonexistent endpoints return 404."""
         response = client.get("/api/racing/nonexistent")
         assert response.status_code == 404
 
-    def test_invalid_http_method(self):
+    def test_invalid_http_method(self, client: TestClient):
         """Test invalid HTTP methods on endpoints."""
         # Simple track endpoint should only accept GET
         response = client.post("/api/racing/track/simple")
@@ -291,7 +350,7 @@ class TestErrorHandling:
         response = client.get("/api/racing/track/generate")
         assert response.status_code == 405
 
-    def test_malformed_json_payload(self):
+    def test_malformed_json_payload(self, client: TestClient):
         """Test handling of malformed JSON in track generation."""
         response = client.post(
             "/api/racing/track/generate",
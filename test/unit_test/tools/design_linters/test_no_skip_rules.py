@@ -14,39 +14,33 @@ Implementation: Fixture-based testing with parametrized test cases
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 import pytest
 from tools.design_linters.framework.base_interfaces import BaseLintContext
 from tools.design_linters.rules.enforcement.no_skip_rules import NoSkipRule
 
+_EXT_TO_LANG = {".py": "python", ".ts": "typescript", ".tsx": "typescript", ".tf": "terraform", ".sh": "shell"}
 
-@dataclass
+
+@dataclass(frozen=True)
 class MockContext(BaseLintContext):
     """Mock context for testing."""
 
     file_path: Path | str | None = None
     file_content: str | None = None
 
-    @property
+    @cached_property
     def language(self) -> str:
-        """Get the language of the file."""
-        if isinstance(self.file_path, Path):
-            suffix = self.file_path.suffix
-        elif isinstance(self.file_path, str):
-            suffix = Path(self.file_path).suffix
-        else:
+        """Get the language of the file, resolved once per context."""
+        if not self.file_path:
             return "unknown"
+        return _EXT_TO_LANG.get(Path(self.file_path).suffix, "unknown")
 
-        if suffix == ".py":
-            return "python"
-        if suffix in {".ts", ".tsx"}:
-            return "typescript"
-        if suffix == ".tf":
-            return "terraform"
-        if suffix == ".sh":
-            return "shell"
-        return "unknown"
+    def get_context_description(self) -> str:
+        """Get human-readable context description."""
+        return f"file {self.file_path}" if self.file_path else "unknown file"
 
 
 class TestNoSkipRulePython:
@@ -56,7 +50,7 @@ class TestNoSkipRulePython:
         """Test that noqa: C901 is detected and flagged."""
         rule = NoSkipRule()
         context = MockContext(
-            file_path=Path("test_module.py"),
+            file_path=Path("complex_module.py"),
             file_content="def complex_function():  # noqa: C901\n    pass\n",
         )
 
@@ -293,6 +287,21 @@ class TestNoSkipRuleEdgeCases:
 
         assert len(violations) == 0
 
+    @pytest.mark.parametrize(
+        "file_name,expected",
+        [
+            ("hooks.ts", "typescript"),
+            ("component.tsx", "typescript"),
+            ("main.tf", "terraform"),
+            ("script.sh", "shell"),
+            ("README.md", "unknown"),
+        ],
+        ids=["ts", "tsx", "tf", "sh", "md"],
+    )
+    def test_mock_context_language(self, file_name, expected):
+        """Test that the mock context maps non-Python extensions to their language."""
+        assert MockContext(file_path=Path(file_name)).language == expected
+
     def test_rule_metadata(self):
         """Test that rule metadata is correct."""
         rule = NoSkipRule()
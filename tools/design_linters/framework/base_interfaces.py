@@ -26,6 +26,8 @@ from .types import LintViolation, Severity
 class BaseLintContext(ABC):
     """Base class for language-agnostic lint contexts."""
 
+    __slots__ = ()  # Lets slotted subclasses drop the per-instance __dict__
+
     @property
     @abstractmethod
     def file_path(self) -> Path | None:
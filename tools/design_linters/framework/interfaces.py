@@ -159,7 +159,7 @@ class FileBasedLintRule(LintRule):
         return check_file_with_ignores(self, context, self.check_file)
 
 
-@dataclass
+@dataclass(slots=True)
 class LintContext(BaseLintContext):  # pylint: disable=too-many-instance-attributes
     """Context information for rule checking (Python-specific, inherits from BaseLintContext)."""
 
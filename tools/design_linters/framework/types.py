@@ -65,7 +65,7 @@ class Severity(Enum):  # design-lint: ignore[solid.srp.low-cohesion]
         raise ValueError(f"Invalid severity value: {value}")
 
 
-@dataclass
+@dataclass(slots=True)
 class LintViolation:  # pylint: disable=too-many-instance-attributes
     """Represents a detected linting violation."""
 
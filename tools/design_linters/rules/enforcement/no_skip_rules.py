@@ -50,23 +50,31 @@ class NoSkipRule(BaseLintRule):
     # Skip patterns to detect
     SKIP_PATTERNS = {
         "python": [
-            r"#\s*noqa(?::\s*([A-Z]\d+(?:,\s*[A-Z]\d+)*))?",  # noqa or noqa: E501
-            r"#\s*pylint:\s*disable=([a-zA-Z0-9_,-]+)",  # pylint: disable=rule-name
-            r"#\s*type:\s*ignore(?:\[([a-z0-9_,-]+)\])?",  # type: ignore or type: ignore[rule]
+            re.compile(r"#\s*noqa(?::\s*([A-Z]\d+(?:,\s*[A-Z]\d+)*))?"),  # noqa or noqa: E501
+            re.compile(r"#\s*pylint:\s*disable=([a-zA-Z0-9_,-]+)"),  # pylint: disable=rule-name
+            re.compile(r"#\s*type:\s*ignore(?:\[([a-z0-9_,-]+)\])?"),  # type: ignore or type: ignore[rule]
         ],
         "typescript": [
-            r"//\s*eslint-disable(?:-next-line)?(?:\s+([a-zA-Z0-9/@_,-]+))?",  # eslint-disable rule-name
-            r"//\s*@ts-ignore",  # @ts-ignore
-            r"//\s*@ts-nocheck",  # @ts-nocheck
+            re.compile(r"//\s*eslint-disable(?:-next-line)?(?:\s+([a-zA-Z0-9/@_,-]+))?"),  # eslint-disable rule-name
+            re.compile(r"//\s*@ts-ignore"),  # @ts-ignore
+            re.compile(r"//\s*@ts-nocheck"),  # @ts-nocheck
         ],
         "terraform": [
-            r"#\s*tflint-ignore:\s*([a-zA-Z0-9_-]+)",  # tflint-ignore: rule-name
+            re.compile(r"#\s*tflint-ignore:\s*([a-zA-Z0-9_-]+)"),  # tflint-ignore: rule-name
         ],
         "shell": [
-            r"#\s*shellcheck\s+disable=([A-Z0-9,]+)",  # shellcheck disable=SC2086
+            re.compile(r"#\s*shellcheck\s+disable=([A-Z0-9,]+)"),  # shellcheck disable=SC2086
         ],
     }
 
+    # Comment marker every skip pattern for the language starts with
+    COMMENT_SIGILS = {
+        "python": "#",
+        "typescript": "//",
+        "terraform": "#",
+        "shell": "#",
+    }
+
     # Whitelist: Patterns that are allowed to be skipped
     WHITELIST_PATTERNS = {
         "python": [
@@ -115,12 +123,21 @@ class NoSkipRule(BaseLintRule):
         if not language:
             return []
 
+        # Files without a single comment cannot contain a skip directive
+        sigil = self.COMMENT_SIGILS[language]
+        if sigil not in context.file_content:
+            return []
+
         violations: list[LintViolation] = []
         lines = context.file_content.splitlines()
+        patterns = self.SKIP_PATTERNS.get(language, [])
 
         for line_num, line in enumerate(lines, start=1):
-            for pattern in self.SKIP_PATTERNS.get(language, []):
-                match = re.search(pattern, line)
+            # A plain substring scan rules out lines without a comment before any regex runs
+            if sigil not in line:
+                continue
+            for pattern in patterns:
+                match = pattern.search(line)
                 if match:
                     skipped_rule = self._extract_skipped_rule(match)
                     if self._is_critical_skip(language, skipped_rule, file_path, line):
@@ -19,6 +19,7 @@ Implementation: Rule-based architecture with focus on API security patterns
 """
 
 import ast
+import re
 
 from tools.design_linters.framework.interfaces import ASTLintRule, LintContext, LintViolation, Severity
 
@@ -292,6 +293,9 @@ class InsecureExceptionHandlingRule(ASTLintRule):
 class HardcodedSecretsRule(ASTLintRule):
     """Rule to detect hardcoded secrets and credentials."""
 
+    SECRET_NAME_PATTERN = re.compile("password|secret|key|token|credential|auth", re.IGNORECASE)
+    DUMMY_VALUE_PATTERN = re.compile("test|dummy|example|placeholder", re.IGNORECASE)
+
     @property
     def rule_id(self) -> str:
         return "security.secrets.hardcoded"
@@ -313,8 +317,10 @@ class HardcodedSecretsRule(ASTLintRule):
         return {"security", "secrets", "credentials"}
 
     def should_check_node(self, node: ast.AST, context: LintContext) -> bool:
-        """Check if node is an assignment that might contain secrets."""
-        return isinstance(node, ast.Assign)
+        """Check if node is an assignment of a string literal, the only kind that can hold a secret."""
+        return (
+            isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)
+        )
 
     def check_node(self, node: ast.AST, context: LintContext) -> list[LintViolation]:
         """Check if assignment contains hardcoded secrets."""
@@ -336,30 +342,24 @@ class HardcodedSecretsRule(ASTLintRule):
 
     def _contains_hardcoded_secret(self, node: ast.Assign) -> bool:
         """Check if assignment contains hardcoded secrets."""
-        secret_indicators = {"password", "secret", "key", "token", "credential", "auth"}
-
         for target in node.targets:
-            if isinstance(target, ast.Name) and self._is_secret_assignment(target, node.value, secret_indicators):
+            if isinstance(target, ast.Name) and self._is_secret_assignment(target, node.value):
                 return True
 
         return False
 
-    def _is_secret_assignment(self, target: ast.Name, value: ast.AST, secret_indicators: set[str]) -> bool:
+    def _is_secret_assignment(self, target: ast.Name, value: ast.AST) -> bool:
         """Check if this assignment contains a secret value."""
-        var_name = target.id.lower()
-
-        # Check if variable name suggests a secret
-        if not any(indicator in var_name for indicator in secret_indicators):
+        # Check if value is a string literal (cheap type check before any regex scan)
+        if not (isinstance(value, ast.Constant) and isinstance(value.value, str)):
             return False
 
-        # Check if value is a string literal
-        if not (isinstance(value, ast.Constant) and isinstance(value.value, str)):
+        # Check if variable name suggests a secret
+        if not self.SECRET_NAME_PATTERN.search(target.id):
             return False
 
         # Ignore obvious dummy values
-        value_str = value.value.lower()
-        dummy_values = ["test", "dummy", "example", "placeholder"]
-        return not any(dummy in value_str for dummy in dummy_values)
+        return not self.DUMMY_VALUE_PATTERN.search(value.value)
 
 
 class MissingSecurityHeadersRule(ASTLintRule):
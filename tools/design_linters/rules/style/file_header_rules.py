@@ -23,6 +23,7 @@ from pathlib import Path
 from typing import Any
 
 from loguru import logger
+from tools.design_linters.framework.ignore_utils import has_file_level_ignore
 from tools.design_linters.framework.interfaces import (
     ASTLintRule,
     LintContext,
@@ -101,18 +102,20 @@ class TemporalLanguageChecker:
     """Handles detection and validation of temporal language in headers."""
 
     TEMPORAL_PATTERNS = {
-        "date_stamps": r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b|\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b",
-        "created_updated": r"\b(created|updated|modified|changed)\s*(on|at|:)?\s*\d",
-        "state_changes": r"\b(was|were|had been|has been|have been|will be|would be)\b",
-        "temporal_qualifiers": r"\b(recently|currently|now|today|yesterday|tomorrow|soon|later)\b",
-        "future_references": r"\b(will|shall|going to|plan to|intend to|expect to)\b",
+        "date_stamps": re.compile(r"\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b|\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b", re.IGNORECASE),
+        "created_updated": re.compile(r"\b(created|updated|modified|changed)\s*(on|at|:)?\s*\d", re.IGNORECASE),
+        "state_changes": re.compile(r"\b(was|were|had been|has been|have been|will be|would be)\b", re.IGNORECASE),
+        "temporal_qualifiers": re.compile(
+            r"\b(recently|currently|now|today|yesterday|tomorrow|soon|later)\b", re.IGNORECASE
+        ),
+        "future_references": re.compile(r"\b(will|shall|going to|plan to|intend to|expect to)\b", re.IGNORECASE),
     }
 
     def check_temporal_language_patterns(self, header_content: str) -> list[dict[str, str]]:
         """Check header for temporal language patterns."""
         temporal_issues = []
         for pattern_type, pattern in self.TEMPORAL_PATTERNS.items():
-            matches = re.findall(pattern, header_content, re.IGNORECASE)
+            matches = pattern.findall(header_content)
             for match in matches:
                 temporal_issues.append({"type": pattern_type, "text": match})
         return temporal_issues
@@ -595,6 +598,18 @@ class FileHeaderRule(ASTLintRule):
         """Return the categories this rule belongs to."""
         return {"style", "documentation"}
 
+    def check(self, context: LintContext) -> list[LintViolation]:
+        """Check the file header, visiting a parsed tree only when one is needed.
+
+        Non-Python files carry their header as plain text, so without a tree they are
+        checked directly instead of requiring a placeholder module to visit.
+        """
+        if context.ast_tree is not None or context.file_path is None or Path(context.file_path).suffix.lower() == ".py":
+            return super().check(context)
+        if not context.file_content or has_file_level_ignore(context.file_content, self.rule_id):
+            return []
+        return self.check_node(None, context)
+
     def should_check_node(self, node: Any, context: LintContext) -> bool:
         """Check if node should be validated (Module nodes only)."""
         import ast